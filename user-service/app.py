@@ -1,136 +1,336 @@
 from flask import Flask
-from prometheus_client import Counter, generate_latest
+from prometheus_client import Counter, generate_latest, CONTENT_TYPE_LATEST
 from flask import jsonify
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 import json
 from datetime import datetime
 from flask import request
 import tempfile
+import uuid
+import glob
+import hashlib
+import collections
+import shutil
+import time
+import threading
+import atexit
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from flask_cors import CORS
 
-def trigger_github_workflow(repo, branch):
-    """Trigger GitHub Actions workflow."""
-    token = os.getenv('GITHUB_TOKEN')
-    if not token:
-        return False, "GitHub token not configured"
-        
-    # Extract owner/repo from clone URL
-    parts = repo.rstrip('.git').split('/')
-    if len(parts) < 2:
-        return False, "Invalid repository URL"
-    owner_repo = '/'.join(parts[-2:])
-    
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    url = f'https://api.github.com/repos/{owner_repo}/actions/workflows'
-    
-    try:
-        # List workflows
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            return False, f"Failed to list workflows: {response.text}"
-            
-        workflows = response.json()
-        if not workflows.get('workflows'):
-            return False, "No workflows found"
-            
-        # Trigger the first available workflow
-        workflow_id = workflows['workflows'][0]['id']
-        trigger_url = f'{url}/{workflow_id}/dispatches'
-        
-        data = {
-            'ref': branch
-        }
-        
-        response = requests.post(trigger_url, headers=headers, json=data)
-        if response.status_code == 204:
-            return True, "GitHub Actions workflow triggered successfully"
-        return False, f"Failed to trigger workflow: {response.text}"
-        
-    except Exception as e:
-        return False, str(e)
+# Optional: orjson decodes the probe payloads a few times faster than stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj):
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+# Optional: talk to the Kubernetes API in-process instead of forking kubectl
+try:
+    from kubernetes import client as k8s_client, config as k8s_config
+except ImportError:
+    k8s_client = None
+
+# Optional: drive the docker daemon over one persistent socket rather than
+# forking the CLI (and re-parsing ~/.docker/config.json) per build/push
+try:
+    import docker as docker_sdk
+except ImportError:
+    docker_sdk = None
+
+# Shared HTTP session so outbound calls reuse pooled keep-alive connections
+# instead of paying a TCP+TLS handshake per request.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                       max_retries=Retry(total=2, backoff_factor=0.2,
+                                         status_forcelist=[502, 503, 504]))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# (connect, read) timeout applied to every outbound call, tunable per
+# deployment so slow upstreams fail fast instead of tying up workers
+HTTP_TIMEOUT = (float(os.environ.get('HTTP_CONNECT_TIMEOUT', '3')),
+                float(os.environ.get('HTTP_READ_TIMEOUT', '5')))
+
+# Shared pool for fanning out the independent /api/overview probes; wall time
+# becomes max(probe latency) instead of the sum of all probe timeouts.
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Tiny TTL memoizer: dashboards poll every couple of seconds from several
+# tabs, but probe results stay valid for a few seconds, so collapse the
+# repeated upstream calls into one.
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def cached(ttl, stale_fallback=False):
+    """Memoize a helper's return value for `ttl` seconds, keyed per-args.
+
+    With stale_fallback, a probe that starts failing (returning None)
+    keeps serving its last good value — marked stale — so the dashboard
+    stays populated through a GitHub/DockerHub outage.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with _CACHE_LOCK:
+                hit = _CACHE.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    return hit[1]
+            value = func(*args, **kwargs)
+            if value is None and stale_fallback and hit is not None and hit[1] is not None:
+                old = hit[1]
+                value = dict(old, stale=True) if isinstance(old, dict) else old
+            with _CACHE_LOCK:
+                _CACHE[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+# Configuration is read once at startup; these sit on the polling hot path.
+PROMETHEUS_URL = os.environ.get('PROMETHEUS_URL') or os.environ.get('PROMETHEUS') or 'http://localhost:9090'
+PROM_QUERY_URL = PROMETHEUS_URL.rstrip('/') + '/api/v1/query'
+GITHUB_REPO = os.environ.get('GITHUB_REPO')
+GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+GITHUB_AUTH_HEADERS = {'Authorization': f'token {GITHUB_TOKEN}'} if GITHUB_TOKEN else None
+JENKINS_URL = os.environ.get('JENKINS_URL')
+JENKINS_JOB = os.environ.get('JENKINS_JOB')
+JENKINS_USER = os.environ.get('JENKINS_USER')
+JENKINS_TOKEN = os.environ.get('JENKINS_TOKEN')
+JENKINS_LASTBUILD_URL = (f"{JENKINS_URL.rstrip('/')}/job/{JENKINS_JOB}/lastBuild/api/json"
+                         if JENKINS_URL and JENKINS_JOB else None)
+DOCKERHUB_REPO = os.environ.get('DOCKERHUB_REPO')
+DOCKERHUB_TAG = os.environ.get('DOCKERHUB_TAG') or 'latest'
+K8S_DEPLOYMENT = os.environ.get('K8S_DEPLOYMENT') or 'user-service'
+K8S_NAMESPACE = os.environ.get('K8S_NAMESPACE') or 'default'
+KUBECTL_PATH = os.environ.get('KUBECTL_PATH') or 'kubectl'
+GRAFANA_URL = os.environ.get('GRAFANA_URL') or os.environ.get('REACT_APP_GRAFANA_URL')
+
+# Resolve the pipeline binaries once so each fork skips the PATH search
+BINS = {name: shutil.which(name) or name
+        for name in ('git', 'pytest', 'npm', 'docker', 'kubectl')}
+
+# /api/tools derives only from startup configuration, so serialize it once
+_TOOLS_BYTES = _json_dumps({
+    'prometheus': PROMETHEUS_URL,
+    'grafana': GRAFANA_URL,
+    'dockerhub': f'https://hub.docker.com/r/{DOCKERHUB_REPO}' if DOCKERHUB_REPO else None,
+    'jenkins': JENKINS_URL,
+    'github': f'https://github.com/{GITHUB_REPO}' if GITHUB_REPO else None,
+})
+
+# Probes whose configuration is missing at startup can be skipped outright
+# instead of being scheduled just to return None (or worse, eat a timeout).
+PROBES_ENABLED = {
+    'github': bool(GITHUB_REPO and GITHUB_TOKEN),
+    'jenkins': bool(JENKINS_URL and JENKINS_JOB),
+    'dockerhub': bool(DOCKERHUB_REPO),
+}
+
+# Circuit breaker for probes that are "configured" by default (Prometheus,
+# kubectl): after a few consecutive failures, skip the upstream for a
+# cooldown window rather than paying its full timeout on every poll.
+_BREAKERS = {}
+_BREAKER_LOCK = threading.Lock()
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30
+
+
+def _breaker_open(name):
+    with _BREAKER_LOCK:
+        return time.monotonic() < _BREAKERS.get(name, (0, 0.0))[1]
+
+
+def _breaker_record(name, ok):
+    with _BREAKER_LOCK:
+        fails, open_until = _BREAKERS.get(name, (0, 0.0))
+        if ok:
+            _BREAKERS[name] = (0, 0.0)
+            return
+        fails += 1
+        if fails >= _BREAKER_THRESHOLD:
+            fails, open_until = 0, time.monotonic() + _BREAKER_COOLDOWN
+        _BREAKERS[name] = (fails, open_until)
+
+
+# Long-lived Kubernetes API client (reuses one TLS connection) built on
+# first use; False means we tried and failed, so stick to the kubectl path.
+_APPS_V1 = None
+_APPS_V1_LOCK = threading.Lock()
+
+
+def _apps_v1():
+    global _APPS_V1
+    if k8s_client is None:
+        return None
+    with _APPS_V1_LOCK:
+        if _APPS_V1 is None:
+            try:
+                try:
+                    k8s_config.load_incluster_config()
+                except Exception:
+                    k8s_config.load_kube_config()
+                _APPS_V1 = k8s_client.AppsV1Api()
+            except Exception:
+                _APPS_V1 = False
+    return _APPS_V1 or None
 
-def trigger_jenkins_job(repo, branch):
-    """Trigger Jenkins job."""
-    jenkins_url = os.getenv('JENKINS_URL')
-    jenkins_job = os.getenv('JENKINS_JOB')
-    jenkins_token = os.getenv('JENKINS_TOKEN')
-    
-    if not all([jenkins_url, jenkins_job, jenkins_token]):
-        return False, "Jenkins configuration incomplete"
-        
-    try:
-        # Build URL with parameters
-        params = {
-            'token': jenkins_token,
-            'GIT_REPO': repo,
-            'GIT_BRANCH': branch
-        }
-        
-        build_url = f'{jenkins_url}/job/{jenkins_job}/buildWithParameters'
-        response = requests.post(build_url, params=params)
-        
-        if response.status_code == 201:
-            return True, "Jenkins job triggered successfully"
-        return False, f"Failed to trigger Jenkins job: {response.status_code}"
-        
-    except Exception as e:
-        return False, str(e)
-import shutil
-import time
 
 app = Flask(__name__)
+
+if orjson is not None:
+    class _OrjsonProvider(DefaultJSONProvider):
+        """Route Flask's jsonify through orjson with no call-site changes."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, data, **kwargs):
+            return orjson.loads(data)
+
+    app.json = _OrjsonProvider(app)
+
 REQUESTS = Counter('http_requests_total', 'Total Requests')
+# Shadow count kept next to the Prometheus counter so dashboard/overview
+# reads are a plain attribute lookup instead of a registry walk.
+_REQUESTS_SEEN = itertools.count(1)
+_REQUESTS_LAST = 0
+
+
+# Query strings are caller-controlled (e.g. /api/overview?repo=...), so the
+# per-view response caches must stay bounded no matter what traffic looks like
+_TTL_CACHE_MAX = 256
+
+
+def ttl_cache(seconds):
+    """Cache a view's full response, keyed on the query string.
+
+    Polling frontends hit these endpoints every second or two from many
+    tabs; serving the serialized body from memory inside the TTL collapses
+    that to one real computation per window.
+    """
+    def decorator(view):
+        store = {}
+        lock = threading.Lock()
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.full_path
+            now = time.monotonic()
+            with lock:
+                hit = store.get(key)
+                if hit is not None and now - hit[0] < seconds:
+                    body, status, headers = hit[1]
+                    resp = Response(body, status=status, headers=headers)
+                    return resp.make_conditional(request)
+            resp = app.make_response(view(*args, **kwargs))
+            with lock:
+                if len(store) >= _TTL_CACHE_MAX:
+                    for k in [k for k, v in store.items() if now - v[0] >= seconds]:
+                        del store[k]
+                    # still full of live entries: drop the oldest insertions
+                    while len(store) >= _TTL_CACHE_MAX:
+                        store.pop(next(iter(store)))
+                store[key] = (now, (resp.get_data(), resp.status_code, dict(resp.headers)))
+            # make_conditional turns the response into a bodiless 304 when
+            # the client's If-None-Match still matches the ETag set below
+            return resp.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+def _requests_total():
+    """Current request count without touching the metrics registry."""
+    return _REQUESTS_LAST
 
 @app.route('/')
 def home():
+    global _REQUESTS_LAST
     REQUESTS.inc()
+    _REQUESTS_LAST = next(_REQUESTS_SEEN)
     return "Hello from user-service!"
 
-@app.route('/metrics')
-def metrics():
-    return generate_latest(), 200, {'Content-Type': 'text/plain'}
+# Prometheus scrapes every 10s or so; re-serializing every collector on
+# each scrape is wasted work, so the exposition bytes are cached briefly.
+_METRICS_LOCK = threading.Lock()
+_METRICS_CACHE = (0.0, b'')
 
 
-@app.route('/api/dashboard')
-def dashboard():
-    """Return a small JSON summary for the frontend dashboard.
+@app.route('/metrics')
+def metrics():
+    global _METRICS_CACHE
+    now = time.monotonic()
+    with _METRICS_LOCK:
+        ts, body = _METRICS_CACHE
+        if now - ts >= 1.0:
+            body = generate_latest()
+            _METRICS_CACHE = (now, body)
+    # content_type= takes the header verbatim; mimetype= would append a
+    # second charset to the already-parameterized exposition type
+    resp = Response(body, content_type=CONTENT_TYPE_LATEST)
+    resp.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+    resp.headers['Cache-Control'] = 'max-age=1'
+    # an unchanged registry between scrapes becomes a bodiless 304
+    return resp.make_conditional(request)
 
-    This is intentionally simple: it exposes pipeline-like stage statuses and a
-    few metrics (requests total). In a production setup you would aggregate
-    this from your CI system or Prometheus queries.
-    """
-    # safe read of counter value (prometheus_client stores as _value)
-    try:
-        requests_total = int(REQUESTS._value.get())
-    except Exception:
-        requests_total = 0
 
-    pipeline_stages = [
+# Everything in the dashboard payload except requestsTotal is static, so
+# the JSON is encoded once at import time and the counter spliced in per
+# request instead of rebuilding and re-serializing the whole structure.
+_DASHBOARD_PREFIX, _DASHBOARD_SUFFIX = _json_dumps({
+    "pipelineStages": [
         {"id": 1, "name": "Code Checkout", "status": "success"},
         {"id": 2, "name": "Unit Testing", "status": "success", "testsPassed": 48, "testsFailed": 1},
         {"id": 3, "name": "Docker Build", "status": "success"},
         {"id": 4, "name": "Docker Push", "status": "success"},
         {"id": 5, "name": "Kubernetes Deploy", "status": "in_progress"}
-    ]
-
-    metrics = {
+    ],
+    "metrics": {
         "requestsPerSecond": None,
         "errorRate": 0.0,
         "cpuUsage": None,
         "memoryUsage": None,
-        "requestsTotal": requests_total
+        "requestsTotal": 0
     }
+}).rsplit(b'0', 1)
+
 
-    return jsonify({"pipelineStages": pipeline_stages, "metrics": metrics})
+@app.route('/api/dashboard')
+@ttl_cache(seconds=2)
+def dashboard():
+    """Return a small JSON summary for the frontend dashboard.
+
+    This is intentionally simple: it exposes pipeline-like stage statuses and a
+    few metrics (requests total). In a production setup you would aggregate
+    this from your CI system or Prometheus queries.
+    """
+    body = _DASHBOARD_PREFIX + str(_requests_total()).encode() + _DASHBOARD_SUFFIX
+    resp = Response(body, mimetype='application/json')
+    resp.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+    resp.headers['Cache-Control'] = 'public, max-age=5'
+    return resp
 
 
 @app.route('/api/overview')
+@ttl_cache(seconds=2)
 def overview():
     """Aggregated overview that queries Prometheus for a few key metrics
 
@@ -140,13 +340,15 @@ def overview():
     This endpoint returns the existing pipeline stage data plus a small set
     of metrics so the frontend can present a single merged dashboard.
     """
-    prom_url = os.environ.get('PROMETHEUS_URL') or os.environ.get('PROMETHEUS') or 'http://localhost:9090'
-
+    @cached(ttl=5)
     def prom_query(q):
+        if _breaker_open('prometheus'):
+            return None
         try:
-            resp = requests.get(f"{prom_url.rstrip('/')}/api/v1/query", params={'query': q}, timeout=5)
+            resp = SESSION.get(PROM_QUERY_URL, params={'query': q}, timeout=HTTP_TIMEOUT)
             resp.raise_for_status()
-            body = resp.json()
+            body = _json_loads(resp.content)
+            _breaker_record('prometheus', True)
             if body.get('status') != 'success':
                 return None
             data = body.get('data', {})
@@ -156,25 +358,22 @@ def overview():
             # pick first result value
             return float(results[0]['value'][1])
         except Exception:
+            _breaker_record('prometheus', False)
             return None
 
     # compute real-ish pipeline stages (best-effort)
-    try:
-        requests_total = int(REQUESTS._value.get())
-    except Exception:
-        requests_total = 0
+    requests_total = _requests_total()
 
-    # Helper: GitHub Actions status
+    # Helper: GitHub Actions status (runs change every few minutes at most)
+    @cached(ttl=15, stale_fallback=True)
     def github_actions_status():
-        repo = os.environ.get('GITHUB_REPO')
-        token = os.environ.get('GITHUB_TOKEN')
-        if not repo or not token:
+        if not GITHUB_REPO or not GITHUB_TOKEN:
             return None
         try:
-            url = f"https://api.github.com/repos/{repo}/actions/runs"
-            resp = requests.get(url, params={'per_page': 1}, headers={'Authorization': f'token {token}'}, timeout=5)
+            url = f"https://api.github.com/repos/{GITHUB_REPO}/actions/runs"
+            resp = SESSION.get(url, params={'per_page': 1}, headers=GITHUB_AUTH_HEADERS, timeout=HTTP_TIMEOUT)
             resp.raise_for_status()
-            body = resp.json()
+            body = _json_loads(resp.content)
             runs = body.get('workflow_runs') or []
             if not runs:
                 return None
@@ -191,21 +390,17 @@ def overview():
             return None
 
     # Helper: Jenkins last build status
+    @cached(ttl=15, stale_fallback=True)
     def jenkins_status():
-        jurl = os.environ.get('JENKINS_URL')
-        job = os.environ.get('JENKINS_JOB')
-        user = os.environ.get('JENKINS_USER')
-        token = os.environ.get('JENKINS_TOKEN')
-        if not jurl or not job:
+        if not JENKINS_LASTBUILD_URL:
             return None
-        api = f"{jurl.rstrip('/')}/job/{job}/lastBuild/api/json"
         try:
-            if user and token:
-                resp = requests.get(api, auth=(user, token), timeout=5)
+            if JENKINS_USER and JENKINS_TOKEN:
+                resp = SESSION.get(JENKINS_LASTBUILD_URL, auth=(JENKINS_USER, JENKINS_TOKEN), timeout=HTTP_TIMEOUT)
             else:
-                resp = requests.get(api, timeout=5)
+                resp = SESSION.get(JENKINS_LASTBUILD_URL, timeout=HTTP_TIMEOUT)
             resp.raise_for_status()
-            b = resp.json()
+            b = _json_loads(resp.content)
             res = b.get('result')
             url = b.get('url')
             if res is None:
@@ -214,31 +409,52 @@ def overview():
         except Exception:
             return None
 
-    # Helper: DockerHub tag existence (public)
+    # Helper: DockerHub tag existence (public; tags rarely change)
+    @cached(ttl=60, stale_fallback=True)
     def dockerhub_status():
-        repo = os.environ.get('DOCKERHUB_REPO')
-        tag = os.environ.get('DOCKERHUB_TAG') or 'latest'
-        if not repo:
+        if not DOCKERHUB_REPO:
             return None
         try:
-            url = f"https://hub.docker.com/v2/repositories/{repo}/tags/{tag}"
-            resp = requests.get(url, timeout=5)
+            url = f"https://hub.docker.com/v2/repositories/{DOCKERHUB_REPO}/tags/{DOCKERHUB_TAG}"
+            resp = SESSION.get(url, timeout=HTTP_TIMEOUT)
             if resp.status_code == 200:
-                return {'status': 'success', 'detail': f'tag {tag} present', 'url': f'https://hub.docker.com/r/{repo}/tags'}
+                return {'status': 'success', 'detail': f'tag {DOCKERHUB_TAG} present', 'url': f'https://hub.docker.com/r/{DOCKERHUB_REPO}/tags'}
             if resp.status_code == 404:
-                return {'status': 'in_progress', 'detail': f'tag {tag} not found', 'url': f'https://hub.docker.com/r/{repo}/tags'}
+                return {'status': 'in_progress', 'detail': f'tag {DOCKERHUB_TAG} not found', 'url': f'https://hub.docker.com/r/{DOCKERHUB_REPO}/tags'}
             return {'status': 'unknown', 'detail': f'status {resp.status_code}'}
         except Exception:
             return None
 
     # Helper: Kubernetes deployment status using kubectl (best-effort local demo)
+    # deployment rollouts move over tens of seconds, so cache longer than
+    # the HTTP-probe helpers
+    @cached(ttl=10)
     def kubernetes_deploy_status():
-        dep = os.environ.get('K8S_DEPLOYMENT') or 'user-service'
-        ns = os.environ.get('K8S_NAMESPACE') or 'default'
-        kubectl = os.environ.get('KUBECTL_PATH') or 'kubectl'
+        dep = K8S_DEPLOYMENT
+        ns = K8S_NAMESPACE
+        # Prefer the in-process API client: no fork/exec, no kubeconfig
+        # parse and no JSON re-decode per call.
+        api = _apps_v1()
+        if api is not None:
+            try:
+                d = api.read_namespaced_deployment_status(name=dep, namespace=ns)
+                spec_replicas = d.spec.replicas or 1
+                available = d.status.available_replicas or 0
+                updated = d.status.updated_replicas or 0
+                if available >= spec_replicas and updated >= spec_replicas:
+                    return {'status': 'success', 'detail': f'{available}/{spec_replicas} replicas available'}
+                return {'status': 'in_progress', 'detail': f'{available}/{spec_replicas} replicas available'}
+            except k8s_client.exceptions.ApiException:
+                return {'status': 'failed', 'detail': 'deployment not found or API error'}
+            except Exception:
+                pass  # fall back to kubectl below
+
+        if _breaker_open('kubectl'):
+            return None
         try:
-            out = subprocess.check_output([kubectl, 'get', 'deployment', dep, '-n', ns, '-o', 'json'], stderr=subprocess.DEVNULL, timeout=5)
-            j = json.loads(out)
+            out = subprocess.check_output([KUBECTL_PATH, 'get', 'deployment', dep, '-n', ns, '-o', 'json'], stderr=subprocess.DEVNULL, timeout=5)
+            _breaker_record('kubectl', True)
+            j = _json_loads(out)
             spec_replicas = j.get('spec', {}).get('replicas', 1)
             available = j.get('status', {}).get('availableReplicas', 0)
             updated = j.get('status', {}).get('updatedReplicas', 0)
@@ -246,7 +462,37 @@ def overview():
                 return {'status': 'success', 'detail': f'{available}/{spec_replicas} replicas available'}
             return {'status': 'in_progress', 'detail': f'{available}/{spec_replicas} replicas available'}
         except subprocess.CalledProcessError:
+            # kubectl ran and answered, so the tooling itself is healthy
+            _breaker_record('kubectl', True)
             return {'status': 'failed', 'detail': 'kubectl error or deployment not found'}
+        except Exception:
+            _breaker_record('kubectl', False)
+            return None
+
+    # Dispatch every independent probe concurrently; each keeps its own
+    # timeout so one slow upstream no longer delays the rest.
+    futures = {
+        'k8s': EXECUTOR.submit(kubernetes_deploy_status),
+        'svc_up': EXECUTOR.submit(prom_query, 'up{job="user-service"}'),
+        # rate() drops the metric name, so the two rates have to stay
+        # separate queries; the pool runs them concurrently anyway
+        'req_rate': EXECUTOR.submit(prom_query, 'sum(rate(http_requests_total[5m]))'),
+        'err_rate': EXECUTOR.submit(prom_query, 'sum(rate(http_errors_total[5m]))'),
+    }
+    # only schedule probes whose configuration exists; the rest stay None
+    if PROBES_ENABLED['github']:
+        futures['gha'] = EXECUTOR.submit(github_actions_status)
+    if PROBES_ENABLED['jenkins']:
+        futures['jnk'] = EXECUTOR.submit(jenkins_status)
+    if PROBES_ENABLED['dockerhub']:
+        futures['dh'] = EXECUTOR.submit(dockerhub_status)
+
+    def probe_result(name):
+        future = futures.get(name)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=10)
         except Exception:
             return None
 
@@ -255,15 +501,15 @@ def overview():
 
     # 1) Source (GitHub repo)
     # repo can be provided by query param (UI) or environment variable
-    gh_repo = request.args.get('repo') or os.environ.get('GITHUB_REPO')
+    gh_repo = request.args.get('repo') or GITHUB_REPO
     if gh_repo:
         stages.append({'id': 1, 'name': 'GitHub Repo', 'status': 'success', 'detail': gh_repo, 'url': f'https://github.com/{gh_repo}'})
     else:
         stages.append({'id': 1, 'name': 'GitHub Repo', 'status': 'unknown', 'detail': 'GITHUB_REPO not set'})
 
     # 2) CI Trigger (GitHub Actions preferred, else Jenkins)
-    gha = github_actions_status()
-    jnk = jenkins_status()
+    gha = probe_result('gha')
+    jnk = probe_result('jnk')
     if gha:
         stages.append({'id': 2, 'name': 'CI Trigger (GitHub Actions)', 'status': gha['status'], 'detail': gha.get('detail'), 'url': gha.get('url')})
     elif jnk:
@@ -284,14 +530,14 @@ def overview():
     stages.append({'id': 3, 'name': 'Docker Build & Unit Tests', 'status': docker_build_status})
 
     # 4) Push Docker Image to DockerHub
-    dh = dockerhub_status()
+    dh = probe_result('dh')
     if dh:
         stages.append({'id': 4, 'name': 'Push to DockerHub', 'status': dh['status'], 'detail': dh.get('detail'), 'url': dh.get('url')})
     else:
         stages.append({'id': 4, 'name': 'Push to DockerHub', 'status': 'unknown', 'detail': 'DOCKERHUB_REPO not set or unreachable'})
 
     # 5) Deploy to Kubernetes
-    k8s = kubernetes_deploy_status()
+    k8s = probe_result('k8s')
     if k8s:
         stages.append({'id': 5, 'name': 'Kubernetes Deploy', 'status': k8s.get('status'), 'detail': k8s.get('detail')})
     else:
@@ -301,7 +547,7 @@ def overview():
     prom_stage_status = 'unknown'
     prom_detail = None
     try:
-        svc_up = prom_query('up{job="user-service"}')
+        svc_up = probe_result('svc_up')
         if svc_up is not None:
             prom_stage_status = 'success' if svc_up > 0 else 'in_progress'
             prom_detail = f'user-service up={svc_up}'
@@ -313,22 +559,19 @@ def overview():
     stages.append({'id': 6, 'name': 'Prometheus Scrape', 'status': prom_stage_status, 'detail': prom_detail})
 
     # 7) Grafana (link only)
-    grafana_url = os.environ.get('GRAFANA_URL') or os.environ.get('REACT_APP_GRAFANA_URL')
+    grafana_url = GRAFANA_URL
     if grafana_url:
         stages.append({'id': 7, 'name': 'Grafana Dashboard', 'status': 'success', 'url': grafana_url})
     else:
         stages.append({'id': 7, 'name': 'Grafana Dashboard', 'status': 'unknown', 'detail': 'GRAFANA_URL not set'})
 
     # Metrics returned to frontend
-    req_rate = prom_query('sum(rate(http_requests_total[5m]))')
+    req_rate = probe_result('req_rate')
     total_reqs = requests_total
     err_rate_val = None
-    try:
-        errs = prom_query('sum(rate(http_errors_total[5m]))')
-        if errs is not None and req_rate:
-            err_rate_val = (errs / req_rate) * 100.0 if req_rate != 0 else None
-    except Exception:
-        err_rate_val = None
+    errs = probe_result('err_rate')
+    if errs is not None and req_rate:
+        err_rate_val = (errs / req_rate) * 100.0
 
     metrics = {
         'requestsPerSecond': req_rate,
@@ -336,31 +579,293 @@ def overview():
         'errorRate': err_rate_val,
     }
 
-    return jsonify({'pipelineStages': stages, 'metrics': metrics, 'prometheus': {'url': prom_url}})
+    resp = jsonify({'pipelineStages': stages, 'metrics': metrics, 'prometheus': {'url': PROMETHEUS_URL}})
+    resp.headers['Cache-Control'] = 'public, max-age=5'
+    return resp
+
+
+# Keep only the tail of command output; npm/docker can emit megabytes
+_LOG_MAX_LINES = 2000
 
 
-def _run_cmd(cmd, cwd=None, timeout=600):
-    """Run a shell command and return (returncode, stdout+stderr)."""
+def _run_cmd(cmd, cwd=None, timeout=600, env=None):
+    """Run a shell command and return (returncode, tail of stdout+stderr).
+
+    Output is streamed into a bounded ring buffer so chatty builds cannot
+    pin megabytes of log in memory; only the last lines are kept and the
+    bytes are decoded once at the end.
+    """
     try:
-        proc = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout, shell=False)
-        out = proc.stdout.decode(errors='replace') if proc.stdout else ''
-        return proc.returncode, out
-    except subprocess.TimeoutExpired:
-        return -1, 'command timed out'
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, shell=False, env=env)
+        ring = collections.deque(maxlen=_LOG_MAX_LINES)
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                ring.append(line)
+            rc = proc.wait()
+        finally:
+            timer.cancel()
+        if timed_out.is_set():
+            return -1, 'command timed out'
+        return rc, b''.join(ring).decode(errors='replace')
     except Exception as e:
         return -1, f'error running command: {e}'
 
 
+def _tail(text, lines=200):
+    """Last `lines` lines of command output — enough to diagnose a failed
+    stage without shipping megabytes of docker/npm chatter in one JSON body."""
+    parts = text.splitlines()
+    return text if len(parts) <= lines else '\n'.join(parts[-lines:])
+
+
+_DOCKER_CLIENT = None
+_DOCKER_CLIENT_LOCK = threading.Lock()
+
+
+def _docker_client():
+    """Lazy docker SDK client; None when the SDK or daemon is unavailable."""
+    global _DOCKER_CLIENT
+    if docker_sdk is None:
+        return None
+    with _DOCKER_CLIENT_LOCK:
+        if _DOCKER_CLIENT is None:
+            try:
+                _DOCKER_CLIENT = docker_sdk.from_env()
+            except Exception:
+                _DOCKER_CLIENT = False
+    return _DOCKER_CLIENT or None
+
+
+def _docker_build(path, tag):
+    """Build an image, preferring the SDK's persistent daemon connection.
+
+    Returns (rc, output) like _run_cmd; falls back to the docker CLI when
+    the SDK is missing or the daemon socket cannot be reached."""
+    client = _docker_client()
+    if client is not None:
+        lines = []
+        try:
+            _, stream = client.images.build(path=path, tag=tag, rm=True)
+            for chunk in stream:
+                text = chunk.get('stream') or chunk.get('error')
+                if text:
+                    lines.append(text.rstrip('\n'))
+                if 'error' in chunk:
+                    return 1, '\n'.join(lines)
+            return 0, '\n'.join(lines)
+        except Exception as e:
+            return 1, '\n'.join(lines + [f'docker sdk build failed: {e}'])
+    return _run_cmd([BINS['docker'], 'build', '-t', tag, '.'], cwd=path, timeout=600)
+
+
+def _docker_push(tag, username, password):
+    """Push `tag`, passing credentials inline via the SDK when available.
+
+    The CLI fallback keeps the login-then-push sequence, feeding the
+    password over stdin so it never appears in the process table."""
+    client = _docker_client()
+    if client is not None:
+        repo_name, _, tag_part = tag.rpartition(':')
+        lines = []
+        try:
+            for chunk in client.images.push(
+                    repo_name, tag=tag_part, stream=True, decode=True,
+                    auth_config={'username': username, 'password': password}):
+                text = chunk.get('status') or chunk.get('error')
+                if text:
+                    lines.append(text)
+                if 'error' in chunk:
+                    return 1, '\n'.join(lines)
+            return 0, '\n'.join(lines)
+        except Exception as e:
+            return 1, '\n'.join(lines + [f'docker sdk push failed: {e}'])
+    login_proc = subprocess.run(
+        [BINS['docker'], 'login', '--username', username, '--password-stdin'],
+        input=password.encode(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    login_out = login_proc.stdout.decode(errors='replace')
+    if login_proc.returncode != 0:
+        return login_proc.returncode, login_out
+    rc, out = _run_cmd([BINS['docker'], 'push', tag], timeout=600)
+    return rc, login_out + '\n' + out
+
+
+# Deleting a cloned tree can take seconds of disk I/O; rename it aside
+# (atomic, microseconds) and let a background thread do the real delete.
+CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_CLEANUP_PREFIX = os.path.join(tempfile.gettempdir(), '_cleanup_')
+
+
+# Temp dirs for jobs that are still running when the worker gets SIGTERMed
+# would otherwise leak; every live clone dir is tracked here and swept on
+# interpreter exit (the startup glob below catches anything a kill -9 left).
+_ACTIVE_TMPDIRS = set()
+_ACTIVE_TMPDIRS_LOCK = threading.Lock()
+
+
+@atexit.register
+def _cleanup_remaining():
+    with _ACTIVE_TMPDIRS_LOCK:
+        leftover = list(_ACTIVE_TMPDIRS)
+        _ACTIVE_TMPDIRS.clear()
+    for path in leftover:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _cleanup_async(path):
+    staging = f'{_CLEANUP_PREFIX}{uuid.uuid4().hex}'
+    try:
+        os.rename(path, staging)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    CLEANUP_EXECUTOR.submit(shutil.rmtree, staging, ignore_errors=True)
+
+
+# sweep any staging dirs a previous crash left behind
+for _stale in glob.glob(f'{_CLEANUP_PREFIX}*'):
+    CLEANUP_EXECUTOR.submit(shutil.rmtree, _stale, ignore_errors=True)
+
+
+# In-memory registry of pipeline runs; each /api/trigger call becomes a
+# background job so the HTTP worker is freed in milliseconds instead of
+# blocking for the clone/test/build/push duration.
+JOBS = {}
+JOBS_LOCK = threading.Lock()
+# The in-memory table only covers the worker that accepted the POST, and
+# gunicorn runs several worker processes — a poll usually lands elsewhere.
+# Every job is therefore mirrored to a JSON file in a shared directory at
+# stage boundaries, so any worker can answer GET /api/trigger/<job_id>.
+_JOBS_DIR = os.path.join(tempfile.gettempdir(), 'pipeline_jobs')
+os.makedirs(_JOBS_DIR, exist_ok=True)
+_JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+
+def _job_path(job_id):
+    return os.path.join(_JOBS_DIR, f'{job_id}.json')
+
+
+def _persist_job(job_id, job):
+    """Mirror a job record to the shared directory (atomic, best-effort)."""
+    try:
+        staging = f'{_job_path(job_id)}.tmp{uuid.uuid4().hex[:8]}'
+        with open(staging, 'wb') as fh:
+            fh.write(_json_dumps(job))
+        os.replace(staging, _job_path(job_id))
+    except Exception:
+        pass
+
+
+def _load_job(job_id):
+    if not _JOB_ID_RE.fullmatch(job_id):
+        return None
+    try:
+        with open(_job_path(job_id), 'rb') as fh:
+            return _json_loads(fh.read())
+    except Exception:
+        return None
+# Finished jobs are kept around for polling but not forever: each carries
+# up to 200 log lines per stage, so old and overflow entries are evicted
+# when new triggers arrive.
+_JOB_TTL_SECONDS = 3600
+_JOBS_MAX = 100
+
+
+def _evict_jobs():
+    """Drop stale or excess finished jobs. Callers must hold JOBS_LOCK."""
+    now = time.time()
+    done = [(jid, j) for jid, j in JOBS.items()
+            if j.get('status') in ('done', 'failed')]
+    for jid, j in done:
+        if now - j.get('createdAt', now) > _JOB_TTL_SECONDS:
+            JOBS.pop(jid, None)
+    overflow = len(JOBS) - _JOBS_MAX
+    if overflow > 0:
+        done.sort(key=lambda kv: kv[1].get('createdAt', 0))
+        for jid, _ in done[:overflow]:
+            JOBS.pop(jid, None)
+    # sweep mirror files too, including ones written by other workers
+    try:
+        for path in glob.glob(os.path.join(_JOBS_DIR, '*.json')):
+            if now - os.path.getmtime(path) > _JOB_TTL_SECONDS:
+                os.unlink(path)
+    except OSError:
+        pass
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+# Pipeline-internal stage work (the overlapped test run) gets its own small
+# pool: a pytest/npm run can hold a slot for minutes, and sharing EXECUTOR
+# with the /api/overview probes would starve the dashboard under load.
+PIPELINE_EXECUTOR = ThreadPoolExecutor(max_workers=3)
+
+# The docker daemon is effectively a single serial resource; jobs queue
+# here for the build/push section only
+DOCKER_SEM = threading.BoundedSemaphore(value=1)
+
+
+# Validate before any filesystem or subprocess work: a malformed trigger
+# must never cost a mkdtemp or reach a git command line.
+_REPO_RE = re.compile(r'[\w.-]+/[\w.-]+')
+_BRANCH_RE = re.compile(r'[\w./-]+')
+
+
+def _validation_error(detail):
+    return jsonify({
+        'pipelineStages': [{
+            'id': 'error',
+            'name': 'Input Validation',
+            'status': 'failed',
+            'detail': detail
+        }]
+    }), 400
+
+
 @app.route('/api/trigger', methods=['POST'])
-def get_ci_config():
-    """Get CI configuration from environment variables."""
-    return {
-        'github_token': os.environ.get('GITHUB_TOKEN'),
-        'jenkins_url': os.environ.get('JENKINS_URL'),
-        'jenkins_job': os.environ.get('JENKINS_JOB'),
-        'jenkins_user': os.environ.get('JENKINS_USER'),
-        'jenkins_token': os.environ.get('JENKINS_TOKEN')
-    }
+def trigger():
+    """Queue a pipeline run for the provided repo and return a job id.
+
+    Expects JSON body: { "repo": "owner/repo", "branch": "main" }
+    Clients poll GET /api/trigger/<job_id> for the stage list.
+    """
+    body = request.get_json(silent=True) or {}
+    repo = body.get('repo') or request.args.get('repo')
+    branch = body.get('branch') or 'main'
+
+    if not repo:
+        return _validation_error('Repository (owner/repo) is required')
+    if not isinstance(repo, str) or not _REPO_RE.fullmatch(repo):
+        return _validation_error('Repository must match owner/repo')
+    if not isinstance(branch, str) or not _BRANCH_RE.fullmatch(branch) or branch.startswith('-'):
+        return _validation_error('Branch name contains unsupported characters')
+
+    job_id = uuid.uuid4().hex
+    with JOBS_LOCK:
+        _evict_jobs()
+        JOBS[job_id] = {'status': 'queued', 'createdAt': time.time(),
+                        'pipelineStages': [], 'metrics': {}}
+        _persist_job(job_id, JOBS[job_id])
+    JOB_EXECUTOR.submit(_run_pipeline, job_id, repo, branch)
+    return jsonify({'jobId': job_id, 'status': 'queued'}), 202
+
+
+@app.route('/api/trigger/<job_id>')
+def trigger_status(job_id):
+    """Return the current state of a queued or running pipeline job."""
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+    if job is None:
+        # accepted by a different gunicorn worker — read the shared mirror
+        job = _load_job(job_id)
+    if job is None:
+        return jsonify({'error': 'unknown job id'}), 404
+    return jsonify(job)
 
 def trigger_github_workflow(repo, branch):
     """Trigger GitHub Actions workflow via API."""
@@ -378,7 +883,7 @@ def trigger_github_workflow(repo, branch):
         }
         data = {"ref": branch}
         
-        response = requests.post(url, headers=headers, json=data)
+        response = SESSION.post(url, headers=headers, json=data, timeout=HTTP_TIMEOUT)
         if response.status_code == 204:
             return True, "GitHub Actions workflow triggered successfully"
         return False, f"Failed to trigger workflow: {response.status_code}"
@@ -407,37 +912,27 @@ def trigger_jenkins_job(repo, branch):
         if jenkins_user and jenkins_token:
             auth = (jenkins_user, jenkins_token)
         
-        response = requests.post(build_url, params=params, auth=auth)
+        response = SESSION.post(build_url, params=params, auth=auth, timeout=HTTP_TIMEOUT)
         if response.status_code in (201, 200):
             return True, "Jenkins job triggered successfully"
         return False, f"Failed to trigger Jenkins job: {response.status_code}"
     except Exception as e:
         return False, f"Error triggering Jenkins job: {str(e)}"
 
-def trigger():
-    """Trigger a pipeline for the provided repo.
-    
-    Expects JSON body: { "repo": "owner/repo", "branch": "main" }
-    """
-    body = request.get_json() or {}
-    repo = body.get('repo') or request.args.get('repo')
-    branch = body.get('branch') or 'main'
-    
-    if not repo:
-        return jsonify({
-            'pipelineStages': [{
-                'id': 'error',
-                'name': 'Input Validation',
-                'status': 'failed',
-                'detail': 'Repository (owner/repo) is required'
-            }]
-        }), 400
+def _run_pipeline(job_id, repo, branch):
+    """Run a queued pipeline job, updating JOBS[job_id] as stages progress."""
+    with JOBS_LOCK:
+        job = JOBS[job_id]
+    job['status'] = 'running'
+    stages = job['pipelineStages']
+    _persist_job(job_id, job)
 
     print(f"Starting pipeline for repo: {repo} branch: {branch}")
-    
+
     # Create temp dir for clone
     tmp = tempfile.mkdtemp(prefix='pipeline_')
-    stages = []
+    with _ACTIVE_TMPDIRS_LOCK:
+        _ACTIVE_TMPDIRS.add(tmp)
     start = time.time()
 
     try:
@@ -450,23 +945,32 @@ def trigger():
         })
 
         clone_url = f'https://github.com/{repo}.git'
-        
-        # Verify repository exists
-        try:
-            resp = requests.head(f'https://github.com/{repo}')
-            if resp.status_code == 404:
-                stages[-1].update({
-                    'status': 'failed',
-                    'detail': f'Repository {repo} not found on GitHub'
-                })
-                return jsonify({'pipelineStages': stages}), 200
-        except Exception as e:
-            print(f'GitHub check failed: {e}')
-            
-        # Attempt clone with detailed error capture
-        rc, out = _run_cmd(['git', 'clone', '--depth', '1', '--branch', branch, clone_url, tmp])
-        stages[-1]['log'] = out
-        
+        git_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+        # ls-remote resolves the tip SHA in a single round-trip and doubles
+        # as the repo/branch existence check before we pay for a clone
+        sha = None
+        ls_rc, ls_out = _run_cmd([BINS['git'], 'ls-remote', clone_url,
+                                  f'refs/heads/{branch}'],
+                                 timeout=60, env=git_env)
+        if ls_rc == 0 and ls_out.split():
+            sha = ls_out.split()[0]
+        # phrased to match the 'branch not found' classifier below
+        rc, out = (1, ls_out or f'branch not found: {branch}') if ls_rc == 0 and not sha else (ls_rc, ls_out)
+
+        if sha:
+            # shallow blobless clone: depth 1 plus --filter=blob:none keeps
+            # the fetch small on large repos, and blobs stream in lazily as
+            # the test/build stages touch them. Protocol v2, single branch,
+            # no tags, and never hang on a credential prompt.
+            rc, out = _run_cmd([BINS['git'], '-c', 'protocol.version=2', 'clone',
+                                '--depth', '1', '--filter=blob:none',
+                                '--single-branch', '--no-tags',
+                                '--branch', branch, clone_url, tmp],
+                               env=git_env)
+        stages[-1]['log'] = _tail(out)
+        _persist_job(job_id, job)
+
         if rc != 0:
             error_detail = 'Unknown error'
             if 'repository not found' in out.lower():
@@ -481,7 +985,7 @@ def trigger():
             stages[-1].update({
                 'status': 'failed',
                 'detail': f'Clone failed: {error_detail}',
-                'log': out
+                'log': _tail(out)
             })
             
             # Try to trigger CI instead
@@ -499,7 +1003,8 @@ def trigger():
                     'status': 'success',
                     'detail': github_msg
                 })
-                return jsonify({'pipelineStages': stages}), 200
+                job['status'] = 'done'
+                return
             
             # Fallback to Jenkins
             jenkins_success, jenkins_msg = trigger_jenkins_job(repo, branch)
@@ -513,76 +1018,83 @@ def trigger():
                     'status': 'failed',
                     'detail': f'CI not configured properly. Set GITHUB_TOKEN or JENKINS_URL/JENKINS_JOB. Details: {github_msg}, {jenkins_msg}'
                 })
-            
-            return jsonify({'pipelineStages': stages}), 200
-
-        # detect commit sha
-        rc, out = _run_cmd(['git', 'rev-parse', 'HEAD'], cwd=tmp)
-        sha = out.strip() if rc == 0 else str(int(time.time()))
-
-        # 2) Run Tests
-        stages.append({'id': 2, 'name': 'Run Unit Tests', 'status': 'in_progress'})
-        test_rc = 0
-        test_out = ''
-        # python project
-        if os.path.exists(os.path.join(tmp, 'requirements.txt')) or os.path.exists(os.path.join(tmp, 'setup.py')):
-            # install deps into virtualenv is out-of-scope; try running pytest directly if available
-            rc, out = _run_cmd(['pytest', '-q'], cwd=tmp, timeout=300)
-            test_rc = rc
-            test_out = out
-        # node project
-        elif os.path.exists(os.path.join(tmp, 'package.json')):
-            rc, out = _run_cmd(['npm', 'ci'], cwd=tmp, timeout=300)
-            out_install = out
-            rc2, out2 = _run_cmd(['npm', 'test', '--', '--watchAll=false'], cwd=tmp, timeout=300)
-            test_rc = rc2
-            test_out = out_install + '\n' + out2
-        else:
-            test_rc = 0
-            test_out = 'no tests detected'
 
-        stages[-1]['log'] = test_out
-        stages[-1]['status'] = 'success' if test_rc == 0 else 'failed'
+            job['status'] = 'done' if jenkins_success else 'failed'
+            return
+
+        # sha came from ls-remote above — no rev-parse subprocess needed
+
+        # 2) Run Tests — submitted to the pipeline pool so the docker build
+        # (which only push/deploy depend on) can overlap the test run
+        test_stage = {'id': 2, 'name': 'Run Unit Tests', 'status': 'in_progress'}
+        stages.append(test_stage)
+
+        def _run_tests():
+            # python project
+            if os.path.exists(os.path.join(tmp, 'requirements.txt')) or os.path.exists(os.path.join(tmp, 'setup.py')):
+                # install deps into virtualenv is out-of-scope; try running pytest directly if available
+                return _run_cmd([BINS['pytest'], '-q'], cwd=tmp, timeout=300)
+            # node project
+            if os.path.exists(os.path.join(tmp, 'package.json')):
+                rc, out_install = _run_cmd([BINS['npm'], 'ci'], cwd=tmp, timeout=300)
+                rc2, out2 = _run_cmd([BINS['npm'], 'test', '--', '--watchAll=false'], cwd=tmp, timeout=300)
+                return rc2, out_install + '\n' + out2
+            return 0, 'no tests detected'
+
+        test_future = PIPELINE_EXECUTOR.submit(_run_tests)
+
+        # build/tag/login/push all talk to the one docker daemon;
+        # serialize those sections across jobs so clones and tests from
+        # other triggered pipelines keep running in parallel
+        with DOCKER_SEM:
+            # 3) Docker build (runs while the tests execute)
+            stages.append({'id': 3, 'name': 'Docker Build', 'status': 'in_progress'})
+            docker_repo = os.environ.get('DOCKERHUB_REPO') or (repo.split('/')[-1])
+            tag = f'{docker_repo}:{sha[:7]}'
+            build_rc, out = _docker_build(tmp, tag)
+            stages[-1]['log'] = _tail(out)
+            stages[-1]['status'] = 'success' if build_rc == 0 else 'failed'
+            _persist_job(job_id, job)
+
+        # join the tests before anything irreversible happens
+        test_rc, test_out = test_future.result()
+        test_stage['log'] = _tail(test_out)
+        test_stage['status'] = 'success' if test_rc == 0 else 'failed'
+        _persist_job(job_id, job)
         if test_rc != 0:
-            return jsonify({'pipelineStages': stages, 'metrics': {}, 'error': 'tests failed'}), 200
-
-        # 3) Docker build
-        stages.append({'id': 3, 'name': 'Docker Build', 'status': 'in_progress'})
-        docker_repo = os.environ.get('DOCKERHUB_REPO') or (repo.split('/')[-1])
-        tag = f'{docker_repo}:{sha[:7]}'
-        rc, out = _run_cmd(['docker', 'build', '-t', tag, '.'], cwd=tmp, timeout=600)
-        stages[-1]['log'] = out
-        stages[-1]['status'] = 'success' if rc == 0 else 'failed'
-        if rc != 0:
-            return jsonify({'pipelineStages': stages, 'metrics': {}, 'error': 'docker build failed'}), 200
-
-        # 4) Docker push (if credentials available)
-        stages.append({'id': 4, 'name': 'Docker Push', 'status': 'in_progress'})
-        dh_user = os.environ.get('DOCKERHUB_USER')
-        dh_pass = os.environ.get('DOCKERHUB_PASS')
-        pushed = False
-        if dh_user and dh_pass:
-            # tag with dockerhub namespace if provided
-            dockerhub_repo = os.environ.get('DOCKERHUB_REPO')
-            if dockerhub_repo:
-                full_tag = f'{dockerhub_repo}:{sha[:7]}'
-                _run_cmd(['docker', 'tag', tag, full_tag], cwd=tmp)
-            else:
-                full_tag = tag
-            # login
-            login_proc = subprocess.run(['docker', 'login', '--username', dh_user, '--password-stdin'], input=dh_pass.encode(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            login_out = login_proc.stdout.decode(errors='replace')
-            if login_proc.returncode == 0:
-                rc2, out2 = _run_cmd(['docker', 'push', full_tag], cwd=tmp, timeout=600)
-                stages[-1]['log'] = login_out + '\n' + out2
+            job['error'] = 'tests failed'
+            job['status'] = 'failed'
+            return
+        if build_rc != 0:
+            job['error'] = 'docker build failed'
+            job['status'] = 'failed'
+            return
+
+        with DOCKER_SEM:
+            # 4) Docker push (if credentials available)
+            stages.append({'id': 4, 'name': 'Docker Push', 'status': 'in_progress'})
+            dh_user = os.environ.get('DOCKERHUB_USER')
+            dh_pass = os.environ.get('DOCKERHUB_PASS')
+            pushed = False
+            if dh_user and dh_pass:
+                # tag with dockerhub namespace if provided
+                dockerhub_repo = os.environ.get('DOCKERHUB_REPO')
+                if dockerhub_repo:
+                    full_tag = f'{dockerhub_repo}:{sha[:7]}'
+                    # the build already used this name when DOCKERHUB_REPO is
+                    # set, so only fork `docker tag` when they actually differ
+                    if full_tag != tag:
+                        _run_cmd([BINS['docker'], 'tag', tag, full_tag], cwd=tmp)
+                else:
+                    full_tag = tag
+                rc2, out2 = _docker_push(full_tag, dh_user, dh_pass)
+                stages[-1]['log'] = _tail(out2)
                 stages[-1]['status'] = 'success' if rc2 == 0 else 'failed'
                 pushed = (rc2 == 0)
             else:
-                stages[-1]['log'] = login_out
-                stages[-1]['status'] = 'failed'
-        else:
-            stages[-1]['log'] = 'DOCKERHUB_USER/DOCKERHUB_PASS not set — skipping push'
-            stages[-1]['status'] = 'in_progress'
+                stages[-1]['log'] = 'DOCKERHUB_USER/DOCKERHUB_PASS not set — skipping push'
+                stages[-1]['status'] = 'in_progress'
+            _persist_job(job_id, job)
 
         # 5) Deploy to Kubernetes (best-effort)
         stages.append({'id': 5, 'name': 'Kubernetes Deploy', 'status': 'in_progress'})
@@ -590,20 +1102,27 @@ def trigger():
         k8s_ns = os.environ.get('K8S_NAMESPACE') or 'default'
         # if pushed, set image to full_tag, else try to use local tag (minikube scenario requires image loaded)
         deploy_tag = full_tag if pushed else tag
-        rc, out = _run_cmd(['kubectl', 'set', 'image', f'deployment/{k8s_dep}', f'{k8s_dep}={deploy_tag}', '-n', k8s_ns], cwd=None, timeout=90)
-        stages[-1]['log'] = out
+        rc, out = _run_cmd([BINS['kubectl'], 'set', 'image', f'deployment/{k8s_dep}', f'{k8s_dep}={deploy_tag}', '-n', k8s_ns], cwd=None, timeout=90)
+        stages[-1]['log'] = _tail(out)
         stages[-1]['status'] = 'success' if rc == 0 else 'failed'
 
-        # return final stages
+        # record final state
         duration = time.time() - start
-        metrics = {'durationSeconds': int(duration)}
-        return jsonify({'pipelineStages': stages, 'metrics': metrics}), 200
+        job['metrics'] = {'durationSeconds': int(duration)}
+        job['status'] = 'done'
 
+    except Exception as e:
+        # nothing consumes the JOB_EXECUTOR future, so an unhandled error
+        # here would otherwise vanish and pin the job at 'running' forever
+        job['error'] = f'pipeline crashed: {e}'
+        job['status'] = 'failed'
     finally:
-        try:
-            shutil.rmtree(tmp)
-        except Exception:
-            pass
+        # every exit path funnels through here, so the mirror always holds
+        # the final status the other workers will serve
+        _persist_job(job_id, job)
+        with _ACTIVE_TMPDIRS_LOCK:
+            _ACTIVE_TMPDIRS.discard(tmp)
+        _cleanup_async(tmp)
 
 
 @app.route('/api/tools')
@@ -612,21 +1131,7 @@ def tools():
 
     These are read from environment variables and translated into user-facing URLs.
     """
-    prom = os.environ.get('PROMETHEUS_URL') or os.environ.get('PROMETHEUS') or 'http://localhost:9090'
-    graf = os.environ.get('GRAFANA_URL') or os.environ.get('REACT_APP_GRAFANA_URL')
-    docker_repo = os.environ.get('DOCKERHUB_REPO')
-    docker_url = f'https://hub.docker.com/r/{docker_repo}' if docker_repo else None
-    jenkins = os.environ.get('JENKINS_URL')
-    github_repo = os.environ.get('GITHUB_REPO')
-    github_url = f'https://github.com/{github_repo}' if github_repo else None
-
-    return jsonify({
-        'prometheus': prom,
-        'grafana': graf,
-        'dockerhub': docker_url,
-        'jenkins': jenkins,
-        'github': github_url
-    })
+    return Response(_TOOLS_BYTES, mimetype='application/json', direct_passthrough=True)
 
 if __name__ == "__main__":
     app.run(host='0.0.0.0', port=5000)
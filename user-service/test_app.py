@@ -21,8 +21,8 @@ class TestCIIntegration(unittest.TestCase):
             self.assertFalse(success)
             self.assertEqual(msg, 'Jenkins URL/job not configured')
 
-    @patch('requests.post')
-    @patch('requests.get')
+    @patch('app.SESSION.post')
+    @patch('app.SESSION.get')
     def test_github_workflow_trigger_success(self, mock_get, mock_post):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -35,7 +35,7 @@ class TestCIIntegration(unittest.TestCase):
             self.assertTrue(success)
             self.assertEqual(msg, 'GitHub Actions workflow triggered successfully')
 
-    @patch('requests.post')
+    @patch('app.SESSION.post')
     def test_jenkins_job_trigger_success(self, mock_post):
         mock_post.return_value.status_code = 201
 
@@ -47,3 +47,33 @@ class TestCIIntegration(unittest.TestCase):
             success, msg = app.trigger_jenkins_job('test/repo', 'main')
             self.assertTrue(success)
             self.assertEqual(msg, 'Jenkins job triggered successfully')
+
+
+class TestTriggerEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.tester = app.app.test_client()
+
+    def test_trigger_rejects_malformed_repo(self):
+        response = self.tester.post('/api/trigger', json={'repo': 'bad repo; rm -rf /'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_trigger_rejects_malformed_branch(self):
+        response = self.tester.post('/api/trigger',
+                                    json={'repo': 'test/repo', 'branch': '--upload-pack=evil'})
+        self.assertEqual(response.status_code, 400)
+
+    @patch('app.JOB_EXECUTOR.submit')
+    def test_trigger_queues_job_and_status_is_retrievable(self, mock_submit):
+        response = self.tester.post('/api/trigger',
+                                    json={'repo': 'test/repo', 'branch': 'main'})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.get_json()['jobId']
+        mock_submit.assert_called_once()
+
+        status = self.tester.get(f'/api/trigger/{job_id}')
+        self.assertEqual(status.status_code, 200)
+        self.assertEqual(status.get_json()['status'], 'queued')
+
+    def test_trigger_status_unknown_job(self):
+        response = self.tester.get('/api/trigger/' + 'f' * 32)
+        self.assertEqual(response.status_code, 404)